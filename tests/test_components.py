@@ -29,3 +29,41 @@
 # CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
 # OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+from yuyo import components
+
+
+class TestComponentExecutor:
+    def test_loads_custom_id_attributes(self):
+        class Executor(components.ComponentExecutor):
+            @components.as_component_callback("aaaaaa")
+            async def on_button(self, ctx: components.ComponentContext) -> None:
+                ...
+
+        executor = Executor()
+
+        assert executor.callbacks == {"aaaaaa": executor.on_button}
+
+    def test_loads_custom_id_attributes_when_inherited(self):
+        class Executor(components.ComponentExecutor):
+            @components.as_component_callback("meow")
+            async def on_button(self, ctx: components.ComponentContext) -> None:
+                ...
+
+        class SubExecutor(Executor):
+            @components.as_component_callback("nyaa")
+            async def on_other_button(self, ctx: components.ComponentContext) -> None:
+                ...
+
+        executor = SubExecutor()
+
+        assert executor.callbacks == {"meow": executor.on_button, "nyaa": executor.on_other_button}
+
+    def test_skips_loading_when_disabled(self):
+        class Executor(components.ComponentExecutor):
+            @components.as_component_callback("aaaaaa")
+            async def on_button(self, ctx: components.ComponentContext) -> None:
+                ...
+
+        executor = Executor(load_from_attributes=False)
+
+        assert executor.callbacks == {}
@@ -29,9 +29,11 @@
 # CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
 # OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+import typing
 from unittest import mock
 
 import hikari
+import pytest
 
 from yuyo import reactions
 
@@ -58,3 +60,42 @@ class TestReactionHandler:
         handler = reactions.ReactionHandler(authors=[123, 321, 543, 1234])
 
         assert handler.authors == {123, 321, 543, 1234}
+
+    def test_loads_reaction_callback_attributes(self):
+        class Handler(reactions.ReactionHandler):
+            @reactions.as_reaction_callback("pog")
+            async def on_reaction(self, event: reactions.EventT) -> None:
+                ...
+
+        handler = Handler()
+
+        assert handler._callbacks == {"pog": (Handler.on_reaction, handler)}
+
+    def test_skips_loading_when_disabled(self):
+        class Handler(reactions.ReactionHandler):
+            @reactions.as_reaction_callback("pog")
+            async def on_reaction(self, event: reactions.EventT) -> None:
+                ...
+
+        handler = Handler(load_from_attributes=False)
+
+        assert handler._callbacks == {}
+
+
+class TestReactionPaginator:
+    @pytest.mark.asyncio()
+    @pytest.mark.parametrize("prefetch", [0, 2, 10])
+    async def test_get_next_entry_returns_every_entry(self, prefetch: int):
+        async def iterate() -> typing.AsyncIterator[typing.Tuple[str, hikari.UndefinedType]]:
+            for index in range(5):
+                yield (f"{index}", hikari.UNDEFINED)
+
+        paginator = reactions.ReactionPaginator(iterate(), authors=[], prefetch=prefetch)
+
+        entries = [await paginator.get_next_entry()]
+        await paginator.open(mock.Mock(), add_reactions=False)
+        while (entry := await paginator.get_next_entry()) is not None:
+            entries.append(entry)
+
+        assert entries == [(f"{index}", hikari.UNDEFINED) for index in range(5)]
+        await paginator.close()
@@ -49,21 +49,30 @@ __all__: typing.Sequence[str] = [
 
 import abc
 import asyncio
+import collections
+import contextlib
 import datetime
-import inspect
 import itertools
+import sys
+import types
 import typing
 import uuid
+import weakref
 
 import hikari
 
 from . import pagination
 
 if typing.TYPE_CHECKING:
-    import types
-
     from hikari import traits
 
+    # These are only ever referenced from (stringified) annotations so evaluating them at runtime
+    # would just slow down cold imports.
+    AbstractComponentExecutorT = typing.TypeVar("AbstractComponentExecutorT", bound="AbstractComponentExecutor")
+    CallbackSig = typing.Callable[["ComponentContext"], typing.Awaitable[None]]
+    CallbackSigT = typing.TypeVar("CallbackSigT", bound=CallbackSig)
+    ResponseT = typing.Union[hikari.api.InteractionMessageBuilder, hikari.api.InteractionDeferredBuilder]
+
     _T = typing.TypeVar("_T")
     _ActionRowExecutorT = typing.TypeVar("_ActionRowExecutorT", bound="ActionRowExecutor")
     _ComponentClientT = typing.TypeVar("_ComponentClientT", bound="ComponentClient")
@@ -89,27 +98,48 @@ def _random_id() -> str:
     return str(uuid.uuid4())
 
 
-AbstractComponentExecutorT = typing.TypeVar("AbstractComponentExecutorT", bound="AbstractComponentExecutor")
-CallbackSig = typing.Callable[["ComponentContext"], typing.Awaitable[None]]
-CallbackSigT = typing.TypeVar("CallbackSigT", bound=CallbackSig)
+def _relay_failure(future: asyncio.Future[typing.Any], task: asyncio.Task[typing.Any], /) -> None:
+    """Propagate an execution task's failure to the response future awaited by the server."""
+    if future.done():
+        return
+
+    if task.cancelled():
+        future.cancel()
+
+    elif (exception := task.exception()) is not None:
+        future.set_exception(exception)
+
+
+# These two are still evaluated at runtime as they parameterize runtime generic base classes.
 ContainerProtoT = typing.TypeVar("ContainerProtoT", bound="_ContainerProto")
 ParentExecutorProtoT = typing.TypeVar("ParentExecutorProtoT", bound="_ParentExecutorProto")
-ResponseT = typing.Union[hikari.api.InteractionMessageBuilder, hikari.api.InteractionDeferredBuilder]
+
+_EPHEMERAL_FLAG: typing.Final[int] = hikari.MessageFlag.EPHEMERAL
+_NO_FLAGS: typing.Final[int] = hikari.MessageFlag.NONE
+
+# The response state a context is in is tracked as a single small int so the response hot paths
+# can branch (or index a dispatch table) off one attribute load.
+_STATE_FRESH: typing.Final[int] = 0
+_STATE_DEFERRED: typing.Final[int] = 1
+_STATE_RESPONDED: typing.Final[int] = 2
 
 
 class ComponentContext:
     """The general context passed around for a component trigger."""
 
     __slots__ = (
-        "_ephemeral_default",
-        "_has_responded",
-        "_has_been_deferred",
+        "_default_flags",
+        "_initial_response_impl",
         "_interaction",
         "_last_response_id",
         "_response_future",
-        "_response_lock",
+        "_response_guard",
+        "_response_in_flight",
+        "_state",
     )
 
+    _POOL: typing.ClassVar[typing.Deque[ComponentContext]] = collections.deque(maxlen=64)
+
     def __init__(
         self,
         *,
@@ -117,13 +147,53 @@ class ComponentContext:
         interaction: hikari.ComponentInteraction,
         response_future: typing.Optional[asyncio.Future[ResponseT]] = None,
     ) -> None:
-        self._ephemeral_default = ephemeral_default
-        self._has_responded = False
-        self._has_been_deferred = False
+        self._reset(ephemeral_default=ephemeral_default, interaction=interaction, response_future=response_future)
+
+    def _reset(
+        self,
+        *,
+        ephemeral_default: bool,
+        interaction: hikari.ComponentInteraction,
+        response_future: typing.Optional[asyncio.Future[ResponseT]] = None,
+    ) -> None:
+        self._default_flags = _EPHEMERAL_FLAG if ephemeral_default else _NO_FLAGS
+        # The initial response strategy is resolved once here so the response hot paths don't
+        # re-branch on whether this context is REST (future backed) or gateway based.
+        self._initial_response_impl = (
+            self._create_initial_response_to_future if response_future else self._create_initial_response_over_rest
+        )
         self._interaction = interaction
         self._last_response_id: typing.Optional[hikari.Snowflake] = None
         self._response_future = response_future
-        self._response_lock = asyncio.Lock()
+        self._response_guard: typing.Optional[asyncio.Event] = None
+        self._response_in_flight = False
+        self._state = _STATE_FRESH
+
+    @classmethod
+    def _acquire(
+        cls,
+        *,
+        ephemeral_default: bool,
+        interaction: hikari.ComponentInteraction,
+        response_future: typing.Optional[asyncio.Future[ResponseT]] = None,
+    ) -> ComponentContext:
+        try:
+            ctx = cls._POOL.pop()
+
+        except IndexError:
+            return cls(
+                ephemeral_default=ephemeral_default, interaction=interaction, response_future=response_future
+            )
+
+        ctx._reset(ephemeral_default=ephemeral_default, interaction=interaction, response_future=response_future)
+        return ctx
+
+    def _release(self) -> None:
+        self._interaction = None  # type: ignore[assignment]
+        self._last_response_id = None
+        self._response_future = None
+        self._response_guard = None
+        self._POOL.append(self)
 
     @property
     def has_been_deferred(self) -> bool:
@@ -136,7 +206,7 @@ class ComponentContext:
 
             This will be true if `ComponentContext.defer` has been called.
         """
-        return self._has_been_deferred
+        return self._state == _STATE_DEFERRED
 
     @property
     def has_responded(self) -> bool:
@@ -155,7 +225,7 @@ class ComponentContext:
             `ComponentContext.create_initial_response` or
             `ComponentContext.edit_initial_response` (after a deferral) has been called.
         """
-        return self._has_responded
+        return self._state == _STATE_RESPONDED
 
     @property
     def interaction(self) -> hikari.ComponentInteraction:
@@ -168,12 +238,31 @@ class ComponentContext:
         """
         return self._interaction
 
-    def _get_flags(self, flags: typing.Union[hikari.UndefinedType, int, hikari.MessageFlag]) -> int:
-        if flags is not hikari.UNDEFINED:
-            assert isinstance(flags, int)
-            return flags
+    @contextlib.asynccontextmanager
+    async def _acquire_response(self) -> typing.AsyncIterator[None]:
+        # Since all the response methods run on the event loop thread and most contexts only ever
+        # make one response, a bool flag covers the common case without the cost of allocating an
+        # asyncio.Lock per interaction; an event is only created when a call actually has to wait.
+        while self._response_in_flight:
+            if self._response_guard is None:
+                self._response_guard = asyncio.Event()
 
-        return hikari.MessageFlag.EPHEMERAL if self._ephemeral_default else hikari.MessageFlag.NONE
+            await self._response_guard.wait()
+
+        self._response_in_flight = True
+        try:
+            yield
+
+        finally:
+            self._response_in_flight = False
+            if self._response_guard is not None:
+                self._response_guard.set()
+                self._response_guard = None
+
+    def _get_flags(self, flags: typing.Union[hikari.UndefinedType, int, hikari.MessageFlag]) -> int:
+        # This is hit by every response path; the ephemeral default is baked into an int when the
+        # context is built, leaving a single identity check here.
+        return flags if flags is not hikari.UNDEFINED else self._default_flags  # type: ignore[return-value]
 
     async def defer(
         self,
@@ -200,11 +289,11 @@ class ComponentContext:
             message create should be only visible by the interaction's author.
         """
         flags = self._get_flags(flags)
-        async with self._response_lock:
-            if self._has_been_deferred or self._has_responded:
+        async with self._acquire_response():
+            if self._state != _STATE_FRESH:
                 raise RuntimeError("Context has already been responded to")
 
-            self._has_been_deferred = True
+            self._state = _STATE_DEFERRED
             if self._response_future:
                 self._response_future.set_result(self._interaction.build_deferred_response(defer_type).set_flags(flags))
 
@@ -358,21 +447,39 @@ class ComponentContext:
         hikari.errors.InternalServerError
             If an internal error occurs on Discord while handling the request.
         """  # noqa: E501 - Line too long
-        async with self._response_lock:
-            message = await self._interaction.execute(
-                content=content,
-                attachment=attachment,
-                attachments=attachments,
-                component=component,
-                components=components,
-                embed=embed,
-                embeds=embeds,
-                flags=self._get_flags(flags),
-                tts=tts,
-                mentions_everyone=mentions_everyone,
-                user_mentions=user_mentions,
-                role_mentions=role_mentions,
-            )
+        async with self._acquire_response():
+            # As with respond, content plus maybe flags is by far the most common followup shape
+            # so it skips passing ten undefined keyword arguments through for re-validation.
+            if (
+                attachment is hikari.UNDEFINED
+                and attachments is hikari.UNDEFINED
+                and component is hikari.UNDEFINED
+                and components is hikari.UNDEFINED
+                and embed is hikari.UNDEFINED
+                and embeds is hikari.UNDEFINED
+                and mentions_everyone is hikari.UNDEFINED
+                and user_mentions is hikari.UNDEFINED
+                and role_mentions is hikari.UNDEFINED
+                and tts is hikari.UNDEFINED
+            ):
+                message = await self._interaction.execute(content, flags=self._get_flags(flags))
+
+            else:
+                message = await self._interaction.execute(
+                    content=content,
+                    attachment=attachment,
+                    attachments=attachments,
+                    component=component,
+                    components=components,
+                    embed=embed,
+                    embeds=embeds,
+                    flags=self._get_flags(flags),
+                    tts=tts,
+                    mentions_everyone=mentions_everyone,
+                    user_mentions=user_mentions,
+                    role_mentions=role_mentions,
+                )
+
             self._last_response_id = message.id
             return message
 
@@ -397,60 +504,114 @@ class ComponentContext:
         tts: hikari.UndefinedOr[bool] = hikari.UNDEFINED,
     ) -> None:
         flags = self._get_flags(flags)
-        if self._has_responded:
+        state = self._state
+        if state == _STATE_RESPONDED:
             raise RuntimeError("Initial response has already been created")
 
-        if self._has_been_deferred:
+        if state == _STATE_DEFERRED:
             raise RuntimeError(
                 "edit_initial_response must be used to set the initial response after a context has been deferred"
             )
 
-        self._has_responded = True
-        if not self._response_future:
-            await self._interaction.create_initial_response(
-                response_type=response_type,
-                content=content,
-                component=component,
-                components=components,
-                embed=embed,
-                embeds=embeds,
-                flags=flags,
-                tts=tts,
-                mentions_everyone=mentions_everyone,
-                user_mentions=user_mentions,
-                role_mentions=role_mentions,
-            )
+        self._state = _STATE_RESPONDED
+        await self._initial_response_impl(
+            response_type,
+            content=content,
+            component=component,
+            components=components,
+            embed=embed,
+            embeds=embeds,
+            mentions_everyone=mentions_everyone,
+            user_mentions=user_mentions,
+            role_mentions=role_mentions,
+            flags=flags,
+            tts=tts,
+        )
 
-        else:
-            if component and components:
-                raise ValueError("Only one of component or components may be passed")
-
-            if embed and embeds:
-                raise ValueError("Only one of embed or embeds may be passed")
-
-            if component:
-                assert not isinstance(component, hikari.UndefinedType)
-                components = (component,)
-
-            if embed:
-                assert not isinstance(embed, hikari.UndefinedType)
-                embeds = (embed,)
-
-            # Pyright doesn't properly support attrs and doesn't account for _ being removed from field
-            # pre-fix in init.
-            result = hikari.impl.InteractionMessageBuilder(
-                type=response_type,  # type: ignore
-                content=content,  # type: ignore
-                components=components,  # type: ignore
-                embeds=embeds,  # type: ignore
-                flags=flags,  # type: ignore
-                is_tts=tts,  # type: ignore
-                mentions_everyone=mentions_everyone,  # type: ignore
-                user_mentions=user_mentions,  # type: ignore
-                role_mentions=role_mentions,  # type: ignore
-            )  # type: ignore
-
-            self._response_future.set_result(result)
+    async def _create_initial_response_over_rest(
+        self,
+        response_type: hikari.ComponentResponseTypesT,
+        /,
+        content: hikari.UndefinedOr[typing.Any] = hikari.UNDEFINED,
+        *,
+        component: hikari.UndefinedOr[hikari.api.ComponentBuilder] = hikari.UNDEFINED,
+        components: hikari.UndefinedOr[typing.Sequence[hikari.api.ComponentBuilder]] = hikari.UNDEFINED,
+        embed: hikari.UndefinedOr[hikari.Embed] = hikari.UNDEFINED,
+        embeds: hikari.UndefinedOr[typing.Sequence[hikari.Embed]] = hikari.UNDEFINED,
+        mentions_everyone: hikari.UndefinedOr[bool] = hikari.UNDEFINED,
+        user_mentions: hikari.UndefinedOr[
+            typing.Union[hikari.SnowflakeishSequence[hikari.PartialUser], bool]
+        ] = hikari.UNDEFINED,
+        role_mentions: hikari.UndefinedOr[
+            typing.Union[hikari.SnowflakeishSequence[hikari.PartialRole], bool]
+        ] = hikari.UNDEFINED,
+        flags: typing.Union[int, hikari.MessageFlag] = hikari.MessageFlag.NONE,
+        tts: hikari.UndefinedOr[bool] = hikari.UNDEFINED,
+    ) -> None:
+        await self._interaction.create_initial_response(
+            response_type=response_type,
+            content=content,
+            component=component,
+            components=components,
+            embed=embed,
+            embeds=embeds,
+            flags=flags,
+            tts=tts,
+            mentions_everyone=mentions_everyone,
+            user_mentions=user_mentions,
+            role_mentions=role_mentions,
+        )
+
+    async def _create_initial_response_to_future(
+        self,
+        response_type: hikari.ComponentResponseTypesT,
+        /,
+        content: hikari.UndefinedOr[typing.Any] = hikari.UNDEFINED,
+        *,
+        component: hikari.UndefinedOr[hikari.api.ComponentBuilder] = hikari.UNDEFINED,
+        components: hikari.UndefinedOr[typing.Sequence[hikari.api.ComponentBuilder]] = hikari.UNDEFINED,
+        embed: hikari.UndefinedOr[hikari.Embed] = hikari.UNDEFINED,
+        embeds: hikari.UndefinedOr[typing.Sequence[hikari.Embed]] = hikari.UNDEFINED,
+        mentions_everyone: hikari.UndefinedOr[bool] = hikari.UNDEFINED,
+        user_mentions: hikari.UndefinedOr[
+            typing.Union[hikari.SnowflakeishSequence[hikari.PartialUser], bool]
+        ] = hikari.UNDEFINED,
+        role_mentions: hikari.UndefinedOr[
+            typing.Union[hikari.SnowflakeishSequence[hikari.PartialRole], bool]
+        ] = hikari.UNDEFINED,
+        flags: typing.Union[int, hikari.MessageFlag] = hikari.MessageFlag.NONE,
+        tts: hikari.UndefinedOr[bool] = hikari.UNDEFINED,
+    ) -> None:
+        assert self._response_future is not None
+        if component and components:
+            raise ValueError("Only one of component or components may be passed")
+
+        if embed and embeds:
+            raise ValueError("Only one of embed or embeds may be passed")
+
+        if component:
+            assert not isinstance(component, hikari.UndefinedType)
+            components = (component,)
+
+        if embed:
+            assert not isinstance(embed, hikari.UndefinedType)
+            embeds = (embed,)
+
+        # Pyright doesn't properly support attrs and doesn't account for _ being removed from field
+        # pre-fix in init.
+        result = hikari.impl.InteractionMessageBuilder(
+            type=response_type,  # type: ignore
+            content=content,  # type: ignore
+            components=components,  # type: ignore
+            embeds=embeds,  # type: ignore
+            flags=flags,  # type: ignore
+            is_tts=tts,  # type: ignore
+            mentions_everyone=mentions_everyone,  # type: ignore
+            user_mentions=user_mentions,  # type: ignore
+            role_mentions=role_mentions,  # type: ignore
+        )  # type: ignore
+
+        self._response_future.set_result(result)
 
     async def create_initial_response(
         self,
@@ -472,7 +633,7 @@ class ComponentContext:
         flags: typing.Union[int, hikari.MessageFlag, hikari.UndefinedType] = hikari.UNDEFINED,
         tts: hikari.UndefinedOr[bool] = hikari.UNDEFINED,
     ) -> None:
-        async with self._response_lock:
+        async with self._acquire_response():
             await self._create_initial_response(
                 response_type,
                 content=content,
@@ -492,7 +653,7 @@ class ComponentContext:
 
     async def delete_last_response(self) -> None:
         if self._last_response_id is None:
-            if self._has_responded:
+            if self._state == _STATE_RESPONDED:
                 await self._interaction.delete_initial_response()
                 return
 
@@ -532,7 +693,7 @@ class ComponentContext:
             user_mentions=user_mentions,
             role_mentions=role_mentions,
         )
-        self._has_responded = True
+        self._state = _STATE_RESPONDED
         return result
 
     async def edit_last_response(
@@ -570,7 +731,7 @@ class ComponentContext:
                 role_mentions=role_mentions,
             )
 
-        if self._has_responded or self._has_been_deferred:
+        if self._state != _STATE_FRESH:
             return await self.edit_initial_response(
                 content=content,
                 attachment=attachment,
@@ -594,11 +755,103 @@ class ComponentContext:
         if self._last_response_id is not None:
             return await self._interaction.fetch_message(self._last_response_id)
 
-        if self._has_responded:
+        if self._state == _STATE_RESPONDED:
             return await self.fetch_initial_response()
 
         raise LookupError("Context has no previous known responses")
 
+    async def _respond_fresh(
+        self,
+        content: hikari.UndefinedOr[typing.Any],
+        *,
+        component: hikari.UndefinedOr[hikari.api.ComponentBuilder],
+        components: hikari.UndefinedOr[typing.Sequence[hikari.api.ComponentBuilder]],
+        embed: hikari.UndefinedOr[hikari.Embed],
+        embeds: hikari.UndefinedOr[typing.Sequence[hikari.Embed]],
+        mentions_everyone: hikari.UndefinedOr[bool],
+        user_mentions: hikari.UndefinedOr[typing.Union[hikari.SnowflakeishSequence[hikari.PartialUser], bool]],
+        role_mentions: hikari.UndefinedOr[typing.Union[hikari.SnowflakeishSequence[hikari.PartialRole], bool]],
+    ) -> typing.Optional[hikari.Message]:
+        await self._create_initial_response(
+            hikari.ResponseType.MESSAGE_CREATE,
+            content=content,
+            component=component,
+            components=components,
+            embed=embed,
+            embeds=embeds,
+            mentions_everyone=mentions_everyone,
+            user_mentions=user_mentions,
+            role_mentions=role_mentions,
+        )
+        return None
+
+    async def _respond_deferred(
+        self,
+        content: hikari.UndefinedOr[typing.Any],
+        *,
+        component: hikari.UndefinedOr[hikari.api.ComponentBuilder],
+        components: hikari.UndefinedOr[typing.Sequence[hikari.api.ComponentBuilder]],
+        embed: hikari.UndefinedOr[hikari.Embed],
+        embeds: hikari.UndefinedOr[typing.Sequence[hikari.Embed]],
+        mentions_everyone: hikari.UndefinedOr[bool],
+        user_mentions: hikari.UndefinedOr[typing.Union[hikari.SnowflakeishSequence[hikari.PartialUser], bool]],
+        role_mentions: hikari.UndefinedOr[typing.Union[hikari.SnowflakeishSequence[hikari.PartialRole], bool]],
+    ) -> typing.Optional[hikari.Message]:
+        return await self.edit_initial_response(
+            content=content,
+            component=component,
+            components=components,
+            embed=embed,
+            embeds=embeds,
+            mentions_everyone=mentions_everyone,
+            user_mentions=user_mentions,
+            role_mentions=role_mentions,
+        )
+
+    async def _respond_responded(
+        self,
+        content: hikari.UndefinedOr[typing.Any],
+        *,
+        component: hikari.UndefinedOr[hikari.api.ComponentBuilder],
+        components: hikari.UndefinedOr[typing.Sequence[hikari.api.ComponentBuilder]],
+        embed: hikari.UndefinedOr[hikari.Embed],
+        embeds: hikari.UndefinedOr[typing.Sequence[hikari.Embed]],
+        mentions_everyone: hikari.UndefinedOr[bool],
+        user_mentions: hikari.UndefinedOr[typing.Union[hikari.SnowflakeishSequence[hikari.PartialUser], bool]],
+        role_mentions: hikari.UndefinedOr[typing.Union[hikari.SnowflakeishSequence[hikari.PartialRole], bool]],
+    ) -> typing.Optional[hikari.Message]:
+        # Button replies are overwhelmingly just content so that case skips building the
+        # full kwargs call for hikari to re-validate.
+        if (
+            component is hikari.UNDEFINED
+            and components is hikari.UNDEFINED
+            and embed is hikari.UNDEFINED
+            and embeds is hikari.UNDEFINED
+            and mentions_everyone is hikari.UNDEFINED
+            and user_mentions is hikari.UNDEFINED
+            and role_mentions is hikari.UNDEFINED
+        ):
+            message = await self._interaction.execute(content)
+
+        else:
+            message = await self._interaction.execute(
+                content,
+                component=component,
+                components=components,
+                embed=embed,
+                embeds=embeds,
+                mentions_everyone=mentions_everyone,
+                user_mentions=user_mentions,
+                role_mentions=role_mentions,
+            )
+
+        self._last_response_id = message.id
+        return message
+
+    # Indexed by the context's current state int, letting respond pick its strategy with a single
+    # tuple index instead of re-checking each state flag in sequence.
+    _respond_methods = (_respond_fresh, _respond_deferred, _respond_responded)
+
     @typing.overload
     async def respond(
         self,
@@ -656,36 +909,10 @@ class ComponentContext:
             typing.Union[hikari.SnowflakeishSequence[hikari.PartialRole], bool]
         ] = hikari.UNDEFINED,
     ) -> typing.Optional[hikari.Message]:
-        async with self._response_lock:
-            if self._has_responded:
-                message = await self._interaction.execute(
-                    content,
-                    component=component,
-                    components=components,
-                    embed=embed,
-                    embeds=embeds,
-                    mentions_everyone=mentions_everyone,
-                    user_mentions=user_mentions,
-                    role_mentions=role_mentions,
-                )
-                self._last_response_id = message.id
-                return message
-
-            if self._has_been_deferred:
-                return await self.edit_initial_response(
-                    content=content,
-                    component=component,
-                    components=components,
-                    embed=embed,
-                    embeds=embeds,
-                    mentions_everyone=mentions_everyone,
-                    user_mentions=user_mentions,
-                    role_mentions=role_mentions,
-                )
-
-            await self._create_initial_response(
-                hikari.ResponseType.MESSAGE_CREATE,
-                content=content,
+        async with self._acquire_response():
+            message = await self._respond_methods[self._state](
+                self,
+                content,
                 component=component,
                 components=components,
                 embed=embed,
@@ -695,6 +922,9 @@ class ComponentContext:
                 role_mentions=role_mentions,
             )
 
+        if message is not None:
+            return message
+
         if ensure_result:
             return await self._interaction.fetch_initial_response()
 
@@ -704,17 +934,41 @@ class ExecutorClosed(Exception):
 
 
 class ComponentClient:
-    __slots__ = ("_event_manager", "_executors", "_gc_task", "_server")
+    __slots__ = (
+        "_dispatch_tasks",
+        "_drain_task",
+        "_event_manager",
+        "_executors",
+        "_gc_task",
+        "_max_executors",
+        "_pending_interactions",
+        "_pinned_executors",
+        "_rest_wake",
+        "_server",
+    )
 
     def __init__(
         self,
         *,
         event_manager: typing.Optional[hikari.api.EventManager] = None,
+        max_executors: int = 4096,
         server: typing.Optional[hikari.api.InteractionServer] = None,
     ) -> None:
+        # The loop only holds weak references to running tasks so the in-flight dispatches are
+        # pinned here until they finish.
+        self._dispatch_tasks: typing.Set[asyncio.Task[None]] = set()
+        self._drain_task: typing.Optional[asyncio.Task[None]] = None
         self._event_manager = event_manager
-        self._executors: typing.Dict[int, AbstractComponentExecutor] = {}
+        # Lookups go through the weak map so executors the caller's dropped can be collected while
+        # pinned executors are kept alive by the bounded strong mapping.
+        self._executors: weakref.WeakValueDictionary[int, AbstractComponentExecutor] = weakref.WeakValueDictionary()
         self._gc_task: typing.Optional[asyncio.Task[None]] = None
+        self._max_executors = max_executors
+        self._pending_interactions: typing.Deque[
+            typing.Tuple[AbstractComponentExecutor, hikari.ComponentInteraction, asyncio.Future[ResponseT]]
+        ] = collections.deque()
+        self._pinned_executors: collections.OrderedDict[int, AbstractComponentExecutor] = collections.OrderedDict()
+        self._rest_wake: typing.Optional[asyncio.Event] = None
         self._server = server
 
     def __enter__(self) -> None:
@@ -742,17 +996,54 @@ class ComponentClient:
                 if executor.has_expired or message_id not in self._executors:
                     continue
 
-                del self._executors[message_id]
+                self._remove_executor(message_id)
                 # This may slow this gc task down but the more we yield the better.
                 # await executor.close()  # TODO: this
 
             await asyncio.sleep(5)  # TODO: is this a good time?
 
+    def _remove_executor(self, message_id: int, /) -> None:
+        self._executors.pop(message_id, None)
+        self._pinned_executors.pop(message_id, None)
+
+    async def _drain(self) -> None:
+        # A single long-lived drainer turns a burst of REST interactions into one wakeup: each
+        # request just appends to the deque and sets the event, and one pass here dispatches the
+        # whole batch.
+        assert self._rest_wake is not None
+        wake = self._rest_wake
+        pending = self._pending_interactions
+        loop = asyncio.get_running_loop()
+        while True:
+            await wake.wait()
+            wake.clear()
+            while pending:
+                executor, interaction, future = pending.popleft()
+                task = loop.create_task(self._execute_executor(executor, interaction, future=future))
+                self._dispatch_tasks.add(task)
+                task.add_done_callback(lambda task, future=future: _relay_failure(future, task))
+                task.add_done_callback(self._dispatch_tasks.discard)
+
     def close(self) -> None:
         if self._gc_task:
             self._gc_task.cancel()
             self._gc_task = None
 
+        if self._drain_task:
+            self._drain_task.cancel()
+            self._drain_task = None
+            self._rest_wake = None
+
+        # Cancelling an in-flight dispatch also cancels its response future through the
+        # _relay_failure done-callback.
+        for task in tuple(self._dispatch_tasks):
+            task.cancel()
+
+        self._dispatch_tasks.clear()
+        while self._pending_interactions:
+            *_, future = self._pending_interactions.popleft()
+            future.cancel()
+
         if self._server:
             self._server.set_listener(hikari.ComponentInteraction, None)
 
@@ -760,7 +1051,8 @@ class ComponentClient:
             self._event_manager.unsubscribe(hikari.InteractionCreateEvent, self.on_gateway_event)
 
         # executor = self._executors
-        self._executors = {}
+        self._executors = weakref.WeakValueDictionary()
+        self._pinned_executors = collections.OrderedDict()
         # for executor in executor.values():  # TODO: finish
         #     executor.close()
 
@@ -781,28 +1073,50 @@ class ComponentClient:
         try:
             await executor.execute(interaction, future=future)
         except ExecutorClosed:
-            self._executors.pop(interaction.message.id, None)
+            self._remove_executor(interaction.message.id)
 
     async def on_gateway_event(self, event: hikari.InteractionCreateEvent, /) -> None:
-        if not isinstance(event.interaction, hikari.ComponentInteraction):
+        # This is called for every interaction create (slash commands and autocompletes included)
+        # so the exact-type check is used as a cheap fast path before falling back to isinstance
+        # for the rare subclass case.
+        interaction = event.interaction
+        if type(interaction) is not hikari.ComponentInteraction and not isinstance(
+            interaction, hikari.ComponentInteraction
+        ):
             return
 
-        if executor := self._executors.get(event.interaction.message.id):
-            await self._execute_executor(executor, event.interaction)
+        message_id = interaction.message.id
+        if executor := self._executors.get(message_id):
+            if message_id in self._pinned_executors:
+                self._pinned_executors.move_to_end(message_id)
+
+            await self._execute_executor(executor, interaction)
 
         else:
-            await event.interaction.create_initial_response(
+            await interaction.create_initial_response(
                 hikari.ResponseType.MESSAGE_CREATE, "This message has timed-out.", flags=hikari.MessageFlag.EPHEMERAL
             )
 
     async def on_rest_request(self, interaction: hikari.ComponentInteraction, /) -> ResponseT:
-        if executor := self._executors.get(interaction.message.id):
+        message_id = interaction.message.id
+        if executor := self._executors.get(message_id):
             if not executor.has_expired:
-                future: asyncio.Future[ResponseT] = asyncio.Future()
-                asyncio.create_task(self._execute_executor(executor, interaction, future=future))
+                if message_id in self._pinned_executors:
+                    self._pinned_executors.move_to_end(message_id)
+
+                loop = asyncio.get_running_loop()
+                future: asyncio.Future[ResponseT] = loop.create_future()
+                self._pending_interactions.append((executor, interaction, future))
+                # The drainer's started lazily on the first request so it's guaranteed to be
+                # created with a running event loop.
+                if self._rest_wake is None:
+                    self._rest_wake = asyncio.Event()
+                    self._drain_task = loop.create_task(self._drain())
+
+                self._rest_wake.set()
                 return await future
 
-            del self._executors[interaction.message.id]
+            self._remove_executor(message_id)
 
         return (
             interaction.build_response(hikari.ResponseType.MESSAGE_CREATE)
@@ -811,9 +1125,39 @@ class ComponentClient:
         )
 
     def add_executor(
-        self: _ComponentClientT, message: hikari.SnowflakeishOr[hikari.Message], executor: AbstractComponentExecutor, /
+        self: _ComponentClientT,
+        message: hikari.SnowflakeishOr[hikari.Message],
+        executor: AbstractComponentExecutor,
+        /,
+        *,
+        pin: bool = True,
     ) -> _ComponentClientT:
-        self._executors[int(message)] = executor
+        """Add an executor to this client.
+
+        Parameters
+        ----------
+        message : hikari.SnowflakeishOr[hikari.Message]
+            The message to executor component interactions for.
+        executor : AbstractComponentExecutor
+            The executor to dispatch matching interactions to.
+
+        Other Parameters
+        ----------------
+        pin : builtins.bool
+            Whether the client should keep the executor alive itself.
+            If `builtins.False` then the executor is only tracked weakly and
+            the caller must hold a reference to it for as long as it should
+            stay active.
+        """
+        message_id = int(message)
+        self._executors[message_id] = executor
+        if pin:
+            self._pinned_executors[message_id] = executor
+            # The least recently triggered executors are evicted first once the cap's been hit to
+            # bound how much memory a long-lived client can hold onto.
+            while len(self._pinned_executors) > self._max_executors:
+                self._pinned_executors.popitem(last=False)
+
         return self
 
 
@@ -826,7 +1170,8 @@ def as_component_callback(custom_id: str, /) -> typing.Callable[[CallbackSigT],
 
 
 class AbstractComponentExecutor(abc.ABC):
-    __slots__ = ()
+    # ComponentClient only holds weak references to un-pinned executors.
+    __slots__ = ("__weakref__",)
 
     @property
     @abc.abstractmethod
@@ -852,34 +1197,85 @@ class AbstractComponentExecutor(abc.ABC):
 
 
 class ComponentExecutor(AbstractComponentExecutor):  # TODO: Not found action?
-    __slots__ = ("_ephemeral_default", "_id_to_callback", "_last_triggered", "_lock", "_timeout")
+    __slots__ = (
+        "_callbacks_view",
+        "_ephemeral_default",
+        "_id_to_callback",
+        "_last_triggered",
+        "_lock",
+        "_pool_contexts",
+        "_semaphore",
+        "_timeout",
+        "_use_jump_table",
+    )
+
+    _custom_id_attrs: typing.ClassVar[typing.Dict[str, str]] = {}
+    _lookup_callback: typing.ClassVar[
+        typing.Optional[typing.Callable[[ComponentExecutor, str], typing.Optional[CallbackSig]]]
+    ] = None
+
+    def __init_subclass__(cls) -> None:
+        super().__init_subclass__()
+        # This is pre-computed per-class to avoid the cost (and descriptor side-effects) of
+        # reflecting over every attribute each time an instance is created.
+        custom_id_attrs: typing.Dict[str, str] = {}
+        seen_names: typing.Set[str] = set()
+        for klass in cls.__mro__:
+            for name, value in vars(klass).items():
+                if name in seen_names:
+                    continue
+
+                seen_names.add(name)
+                custom_id = getattr(value, "__custom_id__", None)
+                if custom_id is not None:
+                    custom_id_attrs[sys.intern(custom_id)] = name
+
+        cls._custom_id_attrs = custom_id_attrs
+        # For the small fixed callback sets declared through decorators (paginators and the like)
+        # a compiled if/elif ladder of interned string compares beats a dict probe, so one's
+        # generated per-subclass here where the IDs are statically known.
+        if 0 < len(custom_id_attrs) <= 8:
+            lines = ["def _lookup_callback(self, custom_id, /):"]
+            branch = "if"
+            for custom_id, name in custom_id_attrs.items():
+                lines.append(f"    {branch} custom_id == {custom_id!r}:")
+                lines.append(f"        return self.{name}")
+                branch = "elif"
+
+            lines.append("    return None")
+            namespace: typing.Dict[str, typing.Any] = {}
+            exec(compile("\n".join(lines), f"<{cls.__qualname__} jump table>", "exec"), {}, namespace)  # noqa: S102
+            cls._lookup_callback = namespace["_lookup_callback"]
+
+        else:
+            cls._lookup_callback = None
 
     def __init__(
         self,
         *,
         ephemeral_default: bool = False,
         load_from_attributes: bool = True,
+        max_concurrent: typing.Optional[int] = None,
+        pool_contexts: bool = False,
         timeout: datetime.timedelta = datetime.timedelta(seconds=30),
     ) -> None:
         self._ephemeral_default = ephemeral_default
         self._id_to_callback: dict[str, CallbackSig] = {}
         self._last_triggered = datetime.datetime.now(tz=datetime.timezone.utc)
         self._lock = asyncio.Lock()
+        self._pool_contexts = pool_contexts
+        self._semaphore = asyncio.Semaphore(max_concurrent) if max_concurrent is not None else None
         self._timeout = timeout
-        if load_from_attributes and type(self) is not ComponentExecutor:
-            for _, value in inspect.getmembers(self):  # TODO: might be a tad bit slow
-                try:
-                    custom_id = value.__custom_id__
-
-                except AttributeError:
-                    pass
+        if load_from_attributes:
+            for custom_id, name in self._custom_id_attrs.items():
+                self._id_to_callback[custom_id] = getattr(self, name)
 
-                else:
-                    self._id_to_callback[custom_id] = value
+        self._callbacks_view = types.MappingProxyType(self._id_to_callback)
+        self._use_jump_table = load_from_attributes and type(self)._lookup_callback is not None
 
     @property
     def callbacks(self) -> typing.Mapping[str, CallbackSig]:
-        return self._id_to_callback.copy()
+        return self._callbacks_view
 
     @property
     def custom_ids(self) -> typing.Collection[str]:
@@ -895,14 +1291,62 @@ class ComponentExecutor(AbstractComponentExecutor):  # TODO: Not found action?
         self, interaction: hikari.ComponentInteraction, /, *, future: typing.Optional[asyncio.Future[ResponseT]] = None
     ) -> None:
         # <<inherited docstring from AbstractComponentExecutor>>.
-        ctx = ComponentContext(
-            ephemeral_default=self._ephemeral_default, interaction=interaction, response_future=future
+        # The miss paths return early rather than raising for stale or forged custom IDs; those
+        # interactions are ignored rather than paying for a KeyError that'd just be swallowed
+        # upstream.
+        if self._use_jump_table:
+            assert self._lookup_callback is not None
+            callback = self._lookup_callback(interaction.custom_id)
+
+        else:
+            callback = self._id_to_callback.get(interaction.custom_id)
+
+        if callback is None:
+            # REST-backed interactions have the server awaiting this future so a stale or forged
+            # custom ID still has to resolve it rather than leave the request hanging.
+            if future is not None:
+                future.set_result(
+                    interaction.build_response(hikari.ResponseType.MESSAGE_CREATE)
+                    .set_content("This message has timed-out.")
+                    .set_flags(hikari.MessageFlag.EPHEMERAL)
+                )
+
+            return
+
+        if self._pool_contexts:
+            ctx = ComponentContext._acquire(
+                ephemeral_default=self._ephemeral_default, interaction=interaction, response_future=future
+            )
+            try:
+                await self._call(callback, ctx)
+
+            finally:
+                ctx._release()
+
+            return
+
+        await self._call(
+            callback,
+            ComponentContext(
+                ephemeral_default=self._ephemeral_default, interaction=interaction, response_future=future
+            ),
         )
-        callback = self._id_to_callback[interaction.custom_id]
-        await callback(ctx)
+
+    async def _call(self, callback: CallbackSig, ctx: ComponentContext, /) -> None:
+        if self._semaphore is not None:
+            async with self._semaphore:
+                await callback(ctx)
+
+        else:
+            await callback(ctx)
 
     def add_callback(self: _ComponentExecutorT, id_: str, callback: CallbackSig, /) -> _ComponentExecutorT:
-        self._id_to_callback[id_] = callback
+        # Interning the registered IDs lets the dict probe in execute short-circuit on identity
+        # for the custom IDs hikari passes back to us.
+        self._id_to_callback[sys.intern(id_)] = callback
+        # The generated ladder only knows about the decorator-declared callbacks so runtime
+        # registration falls this instance back to the dict lookup.
+        self._use_jump_table = False
         return self
 
     def with_callback(self, id_: str, /) -> typing.Callable[[CallbackSigT], CallbackSigT]:
@@ -988,6 +1432,8 @@ class WaitFor(AbstractComponentExecutor):
 class InteractiveButtonBuilder(hikari.impl.InteractiveButtonBuilder[ContainerProtoT]):
     __slots__ = ("_callback",)
 
+    _callback: CallbackSig
+
     def __init__(
         self, callback: CallbackSig, container: ContainerProtoT, custom_id: str, style: hikari.ButtonStyle
     ) -> None:
@@ -1007,6 +1453,8 @@ class InteractiveButtonBuilder(hikari.impl.InteractiveButtonBuilder[ContainerPro
 class SelectMenuBuilder(hikari.impl.SelectMenuBuilder[ContainerProtoT]):
     __slots__ = ("_callback",)
 
+    _callback: CallbackSig
+
     def __init__(self, callback: CallbackSig, container: ContainerProtoT, custom_id: str) -> None:
         self._callback = callback
         # pyright doesn't support attrs _ kwargs
@@ -1022,7 +1470,13 @@ class SelectMenuBuilder(hikari.impl.SelectMenuBuilder[ContainerProtoT]):
 
 
 class ActionRowExecutor(ComponentExecutor, hikari.api.ComponentBuilder):
-    __slots__ = ("_components", "_stored_type")
+    __slots__ = ("_built_cache", "_components", "_stored_type")
+
+    # Annotated at the class level (alongside the slots) so static layout-aware compilers can
+    # infer the field types without tracing __init__.
+    _built_cache: typing.Optional[typing.Dict[str, typing.Any]]
+    _components: typing.List[hikari.api.ComponentBuilder]
+    _stored_type: typing.Optional[hikari.ComponentType]
 
     def __init__(
         self,
@@ -1034,12 +1488,13 @@ class ActionRowExecutor(ComponentExecutor, hikari.api.ComponentBuilder):
         super().__init__(
             ephemeral_default=ephemeral_default, load_from_attributes=load_from_attributes, timeout=timeout
         )
+        self._built_cache: typing.Optional[typing.Dict[str, typing.Any]] = None
         self._components: typing.List[hikari.api.ComponentBuilder] = []
         self._stored_type: typing.Optional[hikari.ComponentType] = None
 
     @property
     def components(self) -> typing.Sequence[hikari.api.ComponentBuilder]:
-        return self._components.copy()
+        return tuple(self._components)
 
     def _assert_can_add_type(self, type_: hikari.ComponentType, /) -> None:
         if self._stored_type is not None and self._stored_type != type_:
@@ -1048,6 +1503,7 @@ class ActionRowExecutor(ComponentExecutor, hikari.api.ComponentBuilder):
         self._stored_type = type_
 
     def add_component(self: _ActionRowExecutorT, component: hikari.api.ComponentBuilder, /) -> _ActionRowExecutorT:
+        self._built_cache = None
         self._components.append(component)
         return self
 
@@ -1109,10 +1565,15 @@ class ActionRowExecutor(ComponentExecutor, hikari.api.ComponentBuilder):
         return SelectMenuBuilder(callback=callback, container=self, custom_id=custom_id)
 
     def build(self) -> typing.Dict[str, typing.Any]:
-        return {
-            "type": hikari.ComponentType.ACTION_ROW,
-            "components": [component.build() for component in self._components],
-        }
+        # Action rows are typically mutated once during setup then re-sent many times so the
+        # built payload is cached until another component is added.
+        if self._built_cache is None:
+            self._built_cache = {
+                "type": hikari.ComponentType.ACTION_ROW,
+                "components": [component.build() for component in self._components],
+            }
+
+        return self._built_cache
 
 
 class ChildActionRowExecutor(ActionRowExecutor, typing.Generic[ParentExecutorProtoT]):
@@ -1120,6 +1581,8 @@ class ChildActionRowExecutor(ActionRowExecutor, typing.Generic[ParentExecutorPro
 
     __slots__ = ("_parent",)
 
+    _parent: ParentExecutorProtoT
+
     def __init__(
         self, parent: ParentExecutorProtoT, *, ephemeral_default: bool = False, load_from_attributes: bool = False
     ) -> None:
@@ -1162,7 +1625,13 @@ class MultiComponentExecutor(AbstractComponentExecutor):
         Defaults to 30 seconds.
     """
 
-    __slots__ = ("_executors", "_last_triggered", "_lock", "_timeout")
+    __slots__ = ("_builders", "_executors", "_last_triggered", "_lock", "_timeout")
+
+    _builders: typing.List[hikari.api.ComponentBuilder]
+    _executors: typing.List[AbstractComponentExecutor]
+    _last_triggered: datetime.datetime
+    _lock: asyncio.Lock
+    _timeout: datetime.timedelta
 
     def __init__(
         self,
@@ -1176,14 +1645,18 @@ class MultiComponentExecutor(AbstractComponentExecutor):
         self._lock = asyncio.Lock()
         self._timeout = timeout
         if load_from_attributes and type(self) is not MultiComponentExecutor:
-            for _, value in inspect.getmembers(self):  # TODO: might be a tad bit slow
-                try:
-                    if value.__is_child_executor__:
+            # Walking the MRO's class dicts avoids the sort and per-attribute getattr calls
+            # (property evaluation included) which inspect.getmembers would make here.
+            seen_names: typing.Set[str] = set()
+            for klass in type(self).__mro__:
+                for name, value in vars(klass).items():
+                    if name in seen_names:
+                        continue
+
+                    seen_names.add(name)
+                    if getattr(value, "__is_child_executor__", False):
                         self._executors.append(value())
 
-                except AttributeError:
-                    pass
-
     @property
     def builders(self) -> typing.Sequence[hikari.api.ComponentBuilder]:
         """Component builders within this executor.
@@ -1324,6 +1797,12 @@ class ComponentPaginator(ActionRowExecutor):
 
     __slots__ = ("_authors", "_buffer", "_index", "_iterator", "_lock")
 
+    _authors: typing.Optional[typing.Set[hikari.Snowflake]]
+    _buffer: typing.List[pagination.EntryT]
+    _index: int
+    _iterator: typing.Optional[pagination.IteratorT[pagination.EntryT]]
+    _lock: asyncio.Lock
+
     def __init__(
         self,
         iterator: pagination.IteratorT[pagination.EntryT],
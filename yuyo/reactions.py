@@ -43,8 +43,12 @@ __all__: typing.Sequence[str] = [
 
 import abc
 import asyncio
+import contextlib
 import datetime
-import inspect
+import itertools
+import sys
+import time
+import types
 import typing
 
 import hikari
@@ -54,9 +58,9 @@ from . import pagination
 
 if typing.TYPE_CHECKING:
     from hikari import traits
-    from hikari.api import event_manager as event_manager_api
 
     _ReactionHandlerT = typing.TypeVar("_ReactionHandlerT", bound="ReactionHandler")
+    _T = typing.TypeVar("_T")
     _ReactionPaginatorT = typing.TypeVar("_ReactionPaginatorT", bound="ReactionPaginator")
     _ReactionClientT = typing.TypeVar("_ReactionClientT", bound="ReactionClient")
 
@@ -65,6 +69,43 @@ class HandlerClosed(Exception):
     ...
 
 
+# Fire-and-forget tasks are kept alive in here until they finish since the event loop only holds
+# a weak reference to running tasks.
+_background_tasks: typing.Set[asyncio.Task[typing.Any]] = set()
+
+
+def _spawn_background_task(coroutine: typing.Coroutine[typing.Any, typing.Any, typing.Any], /) -> None:
+    task = asyncio.create_task(coroutine)
+    _background_tasks.add(task)
+    task.add_done_callback(_background_tasks.discard)
+
+
+async def _gather_bounded(
+    coroutines: typing.Iterable[typing.Coroutine[typing.Any, typing.Any, typing.Any]], /, *, limit: int = 64
+) -> None:
+    """Await the passed coroutines with at most `limit` of them running concurrently.
+
+    Unlike an unbounded `asyncio.gather` call this keeps the number of live tasks
+    capped, topping the window back up as earlier coroutines finish. The first
+    raised exception (if any) is re-raised after every coroutine has finished.
+    """
+    iterator = iter(coroutines)
+    pending = {asyncio.ensure_future(coroutine) for coroutine in itertools.islice(iterator, limit)}
+    error: typing.Optional[BaseException] = None
+    while pending:
+        done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+        for task in done:
+            exception = task.exception()
+            if exception is not None and error is None:
+                error = exception
+
+        for coroutine in itertools.islice(iterator, len(done)):
+            pending.add(asyncio.ensure_future(coroutine))
+
+    if error is not None:
+        raise error
+
+
 class AbstractReactionHandler(abc.ABC):
     """The interface for a reaction handler used with `ReactionClient`."""
 
@@ -135,22 +176,77 @@ CallbackSig = typing.Callable[[EventT], typing.Awaitable[None]]
 CallbackSigT = typing.TypeVar("CallbackSigT", bound=CallbackSig)
 
 
+def _as_snowflake(value: hikari.SnowflakeishOr[typing.Any], /) -> hikari.Snowflake:
+    # hikari's parsed models already hand out Snowflakes so the exact-type check skips an
+    # int-subclass allocation in the common case.
+    return value if type(value) is hikari.Snowflake else hikari.Snowflake(value)
+
+
+def _coerce_identifier(
+    emoji_identifier: typing.Union[str, hikari.SnowflakeishOr[hikari.CustomEmoji]], /
+) -> typing.Union[str, int]:
+    """Normalize an emoji identifier to the form used as a callback key.
+
+    Custom emojis become their snowflake ID while unicode emojis (the UnicodeEmoji str subclass
+    included) become interned plain strs, keeping event-time lookups on C-level comparisons.
+    """
+    if type(emoji_identifier) is str:
+        return sys.intern(emoji_identifier)
+
+    if isinstance(emoji_identifier, hikari.CustomEmoji):
+        return emoji_identifier.id
+
+    if isinstance(emoji_identifier, str):
+        return sys.intern(str(emoji_identifier))
+
+    return emoji_identifier
+
+
 def as_reaction_callback(
     emoji_identifier: typing.Union[hikari.SnowflakeishOr[hikari.CustomEmoji], str], /
 ) -> typing.Callable[[CallbackSigT], CallbackSigT]:
     def decorator(callback: CallbackSigT, /) -> CallbackSigT:
-        nonlocal emoji_identifier
-        if isinstance(emoji_identifier, hikari.CustomEmoji):
-            emoji_identifier = emoji_identifier.id
-
-        callback.__emoji_identifier__ = emoji_identifier
+        callback.__emoji_identifier__ = _coerce_identifier(emoji_identifier)
         return callback
 
     return decorator
 
 
 class ReactionHandler(AbstractReactionHandler):
-    __slots__ = ("_authors", "_callbacks", "_last_triggered", "_lock", "_message", "_timeout")
+    __slots__ = (
+        "_authors",
+        "_authors_frozen",
+        "_callbacks",
+        "_close_task",
+        "_created_at",
+        "_created_at_monotonic",
+        "_last_triggered_monotonic",
+        "_lock",
+        "_message",
+        "_timeout",
+        "_timeout_seconds",
+    )
+
+    _reaction_callback_attrs: typing.ClassVar[typing.Dict[typing.Union[str, int], str]] = {}
+
+    def __init_subclass__(cls) -> None:
+        super().__init_subclass__()
+        # The emoji -> attribute name map is pre-computed per-class since scanning the instance
+        # with inspect.getmembers would getattr every attribute (properties included) on each
+        # construction just to find the decorated methods.
+        reaction_callback_attrs: typing.Dict[typing.Union[str, int], str] = {}
+        seen_names: typing.Set[str] = set()
+        for klass in cls.__mro__:
+            for name, value in vars(klass).items():
+                if name in seen_names:
+                    continue
+
+                seen_names.add(name)
+                identifier = getattr(value, "__emoji_identifier__", None)
+                if identifier is not None:
+                    reaction_callback_attrs[identifier] = name
+
+        cls._reaction_callback_attrs = reaction_callback_attrs
 
     def __init__(
         self,
@@ -159,23 +255,27 @@ class ReactionHandler(AbstractReactionHandler):
         timeout: datetime.timedelta = datetime.timedelta(seconds=30),
         load_from_attributes: bool = True,
     ) -> None:
-        self._authors = set(map(hikari.Snowflake, authors))
-        self._callbacks: typing.Dict[typing.Union[str, int], CallbackSig] = {}
-        self._last_triggered = datetime.datetime.now(tz=datetime.timezone.utc)
-        self._lock = asyncio.Lock()
+        self._authors = {_as_snowflake(author) for author in authors}
+        self._authors_frozen: typing.Optional[typing.FrozenSet[hikari.Snowflake]] = None
+        # Callbacks are stored as (function, bound self) pairs so registering a method keeps a
+        # single reference to the underlying function instead of a per-registration MethodType.
+        self._callbacks: typing.Dict[typing.Union[str, int], typing.Tuple[typing.Any, typing.Any]] = {}
+        self._close_task: typing.Optional[asyncio.Task[None]] = None
+        # Trigger times are tracked as monotonic floats so the expiry check (which the client's
+        # gc task runs against every handler) is a subtract and compare with no datetime or
+        # timedelta allocation; the creation pair below re-anchors them to wall-clock time for
+        # the public last_triggered property.
+        self._created_at = datetime.datetime.now(tz=datetime.timezone.utc)
+        self._created_at_monotonic = time.monotonic()
+        self._last_triggered_monotonic = self._created_at_monotonic
+        self._lock: typing.Optional[asyncio.Lock] = None
         self._message: typing.Optional[hikari.Message] = None
         self._timeout = timeout
+        self._timeout_seconds = timeout.total_seconds()
 
-        if load_from_attributes and type(self) is not ReactionHandler:
-            for _, value in inspect.getmembers(self):
-                try:
-                    identifier = value.__emoji_identifier__
-
-                except AttributeError:
-                    pass
-
-                else:
-                    self._callbacks[identifier] = value
+        if load_from_attributes:
+            for identifier, name in self._reaction_callback_attrs.items():
+                self._callbacks[identifier] = (getattr(type(self), name), self)
 
     @property
     def authors(self) -> typing.AbstractSet[hikari.Snowflake]:
@@ -190,17 +290,23 @@ class ReactionHandler(AbstractReactionHandler):
         typing.AbstractSet[hikari.snowflakes.Snowflake]
             A set of the owner user IDs.
         """
-        return frozenset(self._authors)
+        # The frozen copy is cached between the rare author mutations rather than re-hashing the
+        # whole set on every read.
+        if self._authors_frozen is None:
+            self._authors_frozen = frozenset(self._authors)
+
+        return self._authors_frozen
 
     @property
     def has_expired(self) -> bool:
         # <<inherited docstring from AbstractReactionHandler>>.
-        return self._timeout < datetime.datetime.now(tz=datetime.timezone.utc) - self._last_triggered
+        return time.monotonic() - self._last_triggered_monotonic > self._timeout_seconds
 
     @property
     def last_triggered(self) -> datetime.datetime:
         # <<inherited docstring from AbstractReactionHandler>>.
-        return self._last_triggered
+        delta = self._last_triggered_monotonic - self._created_at_monotonic
+        return self._created_at + datetime.timedelta(seconds=delta)
 
     @property
     def timeout(self) -> datetime.timedelta:
@@ -241,10 +347,16 @@ class ReactionHandler(AbstractReactionHandler):
             This should be a function that accepts a single parameter,
             which is the event that triggered this reaction.
         """
-        if isinstance(emoji_identifier, hikari.CustomEmoji):
-            emoji_identifier = emoji_identifier.id
+        # MethodType can't be subclassed so this check is exact; checking the type (rather than
+        # looking for a `__self__` attribute) avoids falsely unbinding arbitrary callables which
+        # merely expose that attribute name.
+        if isinstance(callback, types.MethodType):
+            entry: typing.Tuple[typing.Any, typing.Any] = (callback.__func__, callback.__self__)
+
+        else:
+            entry = (callback, None)
 
-        self._callbacks[emoji_identifier] = callback
+        self._callbacks[_coerce_identifier(emoji_identifier)] = entry
         return self
 
     def remove_callback(
@@ -260,10 +372,7 @@ class ReactionHandler(AbstractReactionHandler):
             This should be a snowfake if this is for a custom emoji or a string
             if this is for a unicode emoji.
         """
-        if isinstance(emoji_identifier, hikari.CustomEmoji):
-            emoji_identifier = emoji_identifier.id
-
-        del self._callbacks[emoji_identifier]
+        del self._callbacks[_coerce_identifier(emoji_identifier)]
 
     def with_callback(
         self, emoji_identifier: typing.Union[str, hikari.SnowflakeishOr[hikari.CustomEmoji]], /
@@ -285,10 +394,6 @@ class ReactionHandler(AbstractReactionHandler):
         """
 
         def decorator(callback: CallbackSigT, /) -> CallbackSigT:
-            nonlocal emoji_identifier
-            if isinstance(emoji_identifier, hikari.CustomEmoji):
-                emoji_identifier = emoji_identifier.id
-
             self.add_callback(emoji_identifier, callback)
             return callback
 
@@ -296,46 +401,100 @@ class ReactionHandler(AbstractReactionHandler):
 
     async def on_reaction_event(self, event: EventT, /) -> None:
         # <<inherited docstring from AbstractReactionHandler>>.
-        if self.has_expired:
-            asyncio.create_task(self.close())
-            raise
+        # The guards run cheapest-first so events which can't lead to a dispatch (no bound
+        # message, no callbacks, wrong author or unknown emoji) bail before the expiry check.
+        if self._message is None or not self._callbacks:
+            return
 
-        if self._message is None or self._authors and event.user_id not in self._authors:
+        if self._authors and event.user_id not in self._authors:
             return
 
         emoji_identifier = event.emoji_id or event.emoji_name
         assert emoji_identifier is not None
 
-        method = self._callbacks.get(emoji_identifier)
-        if not method:
+        entry = self._callbacks.get(emoji_identifier)
+        if entry is None:
             return
 
-        if not self._lock:
-            self._lock = asyncio.Lock()
+        if self.has_expired:
+            # Reactions tend to pile up on a dead handler so only the first expired event spawns
+            # the close task; the task reference also keeps it safe from the loop's weak refs.
+            if self._close_task is None:
+                self._close_task = asyncio.create_task(self.close())
 
-        async with self._lock:
-            await method(event)
-            self._last_triggered = datetime.datetime.now(tz=datetime.timezone.utc)
+            raise HandlerClosed
 
+        method, bound_self = entry
 
-async def _delete_message(message: hikari.Message, /) -> None:
-    retry = backoff.Backoff()
+        # The lock is only allocated once a callback actually fires so that handlers
+        # which never receive a reaction (the common short-lived case) stay lock-free.
+        lock = self._lock
+        if lock is None:
+            lock = self._lock = asyncio.Lock()
+
+        async with lock:
+            if bound_self is None:
+                await method(event)
 
+            else:
+                await method(bound_self, event)
+
+            self._last_triggered_monotonic = time.monotonic()
+
+
+async def _execute_with_backoff(
+    callback: typing.Callable[[], typing.Awaitable[_T]],
+    retry: backoff.Backoff,
+    /,
+    *,
+    raise_if_over: typing.Optional[float] = None,
+    final_attempt: bool = False,
+) -> typing.Optional[_T]:
+    """Run a REST call under the retry policy shared by the reaction handlers.
+
+    Internal server errors always retry and rate limits wait out their
+    retry_after (raising instead when it exceeds `raise_if_over`); any other
+    error propagates to the caller. If `final_attempt` is `builtins.True` then
+    a depleted backoff ends with one last unguarded call rather than
+    returning `builtins.None`.
+    """
     async for _ in retry:
         try:
-            await message.delete()
-
-        except (hikari.NotFoundError, hikari.ForbiddenError):  # TODO: attempt to check permissions first
-            return
+            return await callback()
 
         except hikari.InternalServerError:
             continue
 
         except hikari.RateLimitedError as exc:
+            if raise_if_over is not None and exc.retry_after > raise_if_over:
+                raise
+
             retry.set_next_backoff(exc.retry_after)
 
-        else:
-            break
+    if final_attempt:
+        return await callback()
+
+    return None
+
+
+async def _delete_message(message: hikari.Message, /) -> None:
+    try:
+        await _execute_with_backoff(message.delete, backoff.Backoff())
+
+    except (hikari.NotFoundError, hikari.ForbiddenError):  # TODO: attempt to check permissions first
+        return
+
+
+# The builtin trigger emojis and their paginator callback attributes, in the order the reactions
+# should appear under a message. The keys are pre-coerced to interned plain strs here so the
+# registrations in `ReactionPaginator.__init__` match what `_coerce_identifier` produces.
+_PAGINATOR_TRIGGERS: typing.Final[typing.Tuple[typing.Tuple[str, str], ...]] = (
+    (sys.intern(str(pagination.LEFT_DOUBLE_TRIANGLE)), "_on_first"),
+    (sys.intern(str(pagination.LEFT_TRIANGLE)), "_on_previous"),
+    (sys.intern(str(pagination.STOP_SQUARE)), "_on_disable"),
+    (sys.intern(str(pagination.RIGHT_TRIANGLE)), "_on_next"),
+    (sys.intern(str(pagination.RIGHT_DOUBLE_TRIANGLE)), "_on_last"),
+)
 
 
 class ReactionPaginator(ReactionHandler):
@@ -360,9 +519,25 @@ class ReactionPaginator(ReactionHandler):
     timeout : datetime.timedelta
         How long it should take for this paginator to timeout.
         This defaults to a timdelta of 30 seconds.
+    prefetch : builtins.int
+        How many entries ahead of the current page a background task should
+        keep buffered while this paginator is open.
+
+        This defaults to `0` (disabled) and is mostly useful for async
+        iterators backed by paginated requests, where it overlaps the fetch
+        of the next pages with the user's think-time.
     """
 
-    __slots__ = ("_buffer", "_index", "_iterator", "_triggers")
+    __slots__ = (
+        "_advance_event",
+        "_buffer",
+        "_entry_event",
+        "_index",
+        "_iterator",
+        "_prefetch",
+        "_prefetch_task",
+        "_triggers",
+    )
 
     def __init__(
         self,
@@ -375,73 +550,115 @@ class ReactionPaginator(ReactionHandler):
             pagination.RIGHT_TRIANGLE,
         ),
         timeout: datetime.timedelta = datetime.timedelta(seconds=30),
+        prefetch: int = 0,
     ) -> None:
         if not isinstance(iterator, (typing.Iterator, typing.AsyncIterator)):
             raise ValueError(f"Invalid value passed for `iterator`, expected an iterator but got {type(iterator)}")
 
         super().__init__(authors=authors, timeout=timeout, load_from_attributes=False)
+        self._advance_event: typing.Optional[asyncio.Event] = None
         self._buffer: typing.List[pagination.EntryT] = []
-        self._index = 0
+        self._entry_event: typing.Optional[asyncio.Event] = None
+        # The entry currently on display is always `_buffer[_index]`; -1 marks that nothing
+        # has been displayed yet.
+        self._index = -1
         self._iterator: typing.Optional[pagination.IteratorT[pagination.EntryT]] = iterator
+        self._prefetch = prefetch
+        self._prefetch_task: typing.Optional[asyncio.Task[None]] = None
         self._triggers = triggers
 
-        if pagination.LEFT_DOUBLE_TRIANGLE in triggers:
-            self.add_callback(pagination.LEFT_DOUBLE_TRIANGLE, self._on_first)
-
-        if pagination.LEFT_TRIANGLE in triggers:
-            self.add_callback(pagination.LEFT_TRIANGLE, self._on_previous)
-
-        if pagination.STOP_SQUARE in triggers:
-            self.add_callback(pagination.STOP_SQUARE, self._on_disable)
-
-        if pagination.RIGHT_TRIANGLE in triggers:
-            self.add_callback(pagination.RIGHT_TRIANGLE, self._on_next)
-
-        if pagination.RIGHT_DOUBLE_TRIANGLE in triggers:
-            self.add_callback(pagination.RIGHT_DOUBLE_TRIANGLE, self._on_last)
+        # The frozenset turns the per-trigger membership tests below into hash probes rather than
+        # linear scans of whatever collection the caller passed.
+        triggers_set = frozenset(triggers)
+        for emoji_name, method_name in _PAGINATOR_TRIGGERS:
+            if emoji_name in triggers_set:
+                self._callbacks[emoji_name] = (getattr(type(self), method_name), self)
 
     async def _edit_message(
         self, *, content: hikari.UndefinedNoneOr[str], embed: hikari.UndefinedNoneOr[hikari.Embed]
     ) -> None:
-        retry = backoff.Backoff()
-
-        async for _ in retry:
-            # Mypy makes the false assumption that this value will stay as None while this function yields.
-            if self._message is None:
-                break  # type: ignore[unreachable]
-
-            try:
+        async def edit() -> None:
+            # The message may be unset while a previous attempt backs off, hence the re-check
+            # per attempt.
+            if self._message is not None:
                 await self._message.edit(content=content, embed=embed)
 
-            except hikari.InternalServerError:
-                continue
-
-            except hikari.RateLimitedError as exc:
-                retry.set_next_backoff(exc.retry_after)
-
-            except (hikari.NotFoundError, hikari.ForbiddenError) as exc:
-                raise HandlerClosed() from exc
+        try:
+            await _execute_with_backoff(edit, backoff.Backoff())
 
-            else:
-                break
+        except (hikari.NotFoundError, hikari.ForbiddenError) as exc:
+            raise HandlerClosed() from exc
 
     async def _on_disable(self, _: EventT, /) -> None:
         if message := self._message:
             self._message = None
             # We create a task here rather than awaiting this to ensure the instance is marked as ended as soon as
             # possible.
-            asyncio.create_task(_delete_message(message))
+            _spawn_background_task(_delete_message(message))
 
         raise HandlerClosed
 
     async def _on_first(self, _: EventT, /) -> None:
         if self._index != 0 and (first_entry := self._buffer[0] if self._buffer else await self.get_next_entry()):
+            self._index = 0
             content, embed = first_entry
             await self._edit_message(content=content, embed=embed)
 
+    async def _prefetch_loop(self) -> None:
+        advance_event = self._advance_event
+        entry_event = self._entry_event
+        assert advance_event is not None and entry_event is not None
+        try:
+            while (iterator := self._iterator) is not None:
+                if len(self._buffer) > self._index + self._prefetch:
+                    # Far enough ahead; park until the consumer advances. There's no await
+                    # between the clear and the wait so an advance can't slip by unseen.
+                    advance_event.clear()
+                    await advance_event.wait()
+                    continue
+
+                entry = await pagination.seek_iterator(iterator, default=None)
+                if entry is None:
+                    self._iterator = None
+                    break
+
+                self._buffer.append(entry)
+                entry_event.set()
+
+        finally:
+            # Always wake any waiting consumer so exhaustion (or a failed iterator) is noticed.
+            entry_event.set()
+
+    async def _drain_iterator(self) -> None:
+        if (task := self._prefetch_task) is not None:
+            self._prefetch_task = None
+            # Rather than cancelling the producer mid-fetch (which could drop an in-flight
+            # entry), let it run unbounded until it has buffered the whole iterator.
+            self._prefetch = sys.maxsize
+            assert self._advance_event is not None
+            self._advance_event.set()
+            await task
+            return
+
+        # This appends straight into the buffer rather than collecting the remaining entries
+        # into a throwaway intermediate list first; for sync iterators the extend stays at the
+        # C level.
+        iterator = self._iterator
+        if iterator is None:
+            return
+
+        self._iterator = None
+        buffer = self._buffer
+        if isinstance(iterator, typing.AsyncIterator):
+            async for entry in iterator:
+                buffer.append(entry)
+
+        else:
+            buffer.extend(iterator)
+
     async def _on_last(self, _: EventT, /) -> None:
         if self._iterator:
-            self._buffer.extend(await pagination.collect_iterator(self._iterator))
+            await self._drain_iterator()
 
         if self._buffer:
             self._index = len(self._buffer) - 1
@@ -449,15 +666,42 @@ class ReactionPaginator(ReactionHandler):
             await self._edit_message(content=content, embed=embed)
 
     async def get_next_entry(self, /) -> typing.Optional[pagination.EntryT]:
+        buffer = self._buffer
+        index = self._index + 1
         # Check to see if we're behind the buffer before trying to go forward in the generator.
-        if len(self._buffer) >= self._index + 2:
-            self._index += 1
-            return self._buffer[self._index]
+        if len(buffer) > index:
+            self._index = index
+            if self._advance_event is not None:
+                self._advance_event.set()
+
+            return buffer[index]
+
+        # When a prefetch task owns the iterator this waits on it to push the buffer forwards
+        # instead of racing it for entries.
+        if (task := self._prefetch_task) is not None:
+            entry_event = self._entry_event
+            assert entry_event is not None
+            while self._iterator is not None and not task.done():
+                entry_event.clear()
+                if len(buffer) > index:
+                    break
+
+                await entry_event.wait()
+
+            if task.done() and not task.cancelled():
+                # Propagate any error the producer hit while fetching.
+                task.result()
+
+            if len(buffer) > index:
+                self._index = index
+                return buffer[index]
+
+            return None
 
         # If entry is not None then the generator's position was pushed forwards.
         if self._iterator and (entry := await pagination.seek_iterator(self._iterator, default=None)):
-            self._index += 1
-            self._buffer.append(entry)
+            buffer.append(entry)
+            self._index = len(buffer) - 1
             return entry
 
     async def _on_next(self, _: EventT, /) -> None:
@@ -479,7 +723,8 @@ class ReactionPaginator(ReactionHandler):
         user : hikari.snowflakes.SnowflakeishOr[hikari.users.User]
             The user to add as an owner for this handler.
         """
-        self._authors.add(hikari.Snowflake(user))
+        self._authors.add(_as_snowflake(user))
+        self._authors_frozen = None
         return self
 
     def remove_author(self, user: hikari.SnowflakeishOr[hikari.User], /) -> None:
@@ -495,9 +740,11 @@ class ReactionPaginator(ReactionHandler):
             The user to remove from this handler's owners..
         """
         try:
-            self._authors.remove(hikari.Snowflake(user))
+            self._authors.remove(_as_snowflake(user))
         except KeyError:
             pass
+        else:
+            self._authors_frozen = None
 
     async def close(
         self,
@@ -515,30 +762,29 @@ class ReactionPaginator(ReactionHandler):
             paginate through this from the previously registered message.
             This defaults to `builtins.False`.
         """
+        if self._prefetch_task is not None:
+            self._prefetch_task.cancel()
+            self._prefetch_task = None
+
         if message := self._message:
             self._message = None
             if not remove_reactions:
                 return
 
-            retry = backoff.Backoff(max_retries=max_retries, maximum=max_backoff)
             # TODO: check if we can just clear the reactions before doing this using the cache.
-            for emoji_name in self._triggers:
-                retry.reset()
-                async for _ in retry:
-                    try:
-                        await message.remove_reaction(emoji_name)
-
-                    except (hikari.NotFoundError, hikari.ForbiddenError):
-                        return
-
-                    except hikari.RateLimitedError as exc:
-                        retry.set_next_backoff(exc.retry_after)
+            async def remove_reaction(emoji_name: str, /) -> None:
+                try:
+                    await _execute_with_backoff(
+                        lambda: message.remove_reaction(emoji_name),
+                        backoff.Backoff(max_retries=max_retries, maximum=max_backoff),
+                    )
 
-                    except hikari.InternalServerError:
-                        continue
+                except (hikari.NotFoundError, hikari.ForbiddenError):
+                    return
 
-                    else:
-                        break
+            # Each removal is an independent HTTP round-trip so they're issued concurrently
+            # (with a backoff each) rather than paying N sequential round-trips.
+            await asyncio.gather(*(remove_reaction(emoji_name) for emoji_name in self._triggers))
 
     async def open(
         self,
@@ -550,38 +796,43 @@ class ReactionPaginator(ReactionHandler):
         max_backoff: float = 2.0,
     ) -> None:
         await super().open(message)
+        if self._prefetch > 0 and self._iterator is not None and self._prefetch_task is None:
+            self._advance_event = asyncio.Event()
+            self._entry_event = asyncio.Event()
+            self._prefetch_task = asyncio.create_task(self._prefetch_loop())
+
         if not add_reactions:
             return
 
-        retry = backoff.Backoff(max_retries=max_retries - 1, maximum=max_backoff)
-        for emoji_name in self._triggers:
-            retry.reset()
-            async for _ in retry:
-                try:
-                    await message.add_reaction(emoji_name)
-
-                except hikari.NotFoundError:
-                    self._message = None
-                    raise
-
-                except hikari.ForbiddenError:  # TODO: attempt to check permissions first
-                    # If this is reached then we just don't have reaction permissions in the channel.
-                    return
-
-                except hikari.RateLimitedError as exc:
-                    if exc.retry_after > max_backoff:
-                        raise
-
-                    retry.set_next_backoff(exc.retry_after)
+        async def add_reaction(emoji_name: str, /) -> None:
+            try:
+                await _execute_with_backoff(
+                    lambda: message.add_reaction(emoji_name),
+                    backoff.Backoff(max_retries=max_retries - 1, maximum=max_backoff),
+                    raise_if_over=max_backoff,
+                    final_attempt=True,
+                )
+
+            except hikari.NotFoundError:
+                self._message = None
+                raise
+
+            except hikari.ForbiddenError:  # TODO: attempt to check permissions first
+                # If this is reached then we just don't have reaction permissions in the channel.
+                return
 
-                except hikari.InternalServerError:
-                    continue
+        # The adds are issued concurrently (each with its own backoff) since the start-up delay
+        # of a paginator is dominated by these sequential round-trips otherwise. Siblings are
+        # cancelled if any add fails for real so this doesn't keep poking a deleted message.
+        tasks = [asyncio.create_task(add_reaction(emoji_name)) for emoji_name in self._triggers]
+        try:
+            await asyncio.gather(*tasks)
 
-                else:
-                    break
+        except Exception:
+            for task in tasks:
+                task.cancel()
 
-            else:
-                await message.add_reaction(emoji_name)
+            raise
 
     async def create_message(
         self,
@@ -624,30 +875,18 @@ class ReactionPaginator(ReactionHandler):
         if self._message is not None:
             raise RuntimeError("ReactionPaginator is already running")
 
-        retry = backoff.Backoff(max_retries=max_retries - 1, maximum=max_backoff)
         entry = await self.get_next_entry()
 
         if entry is None:
             raise ValueError("ReactionPaginator iterator yielded no pages.")
 
-        async for _ in retry:
-            try:
-                message = await rest.create_message(channel_id, content=entry[0], embed=entry[1])
-
-            except hikari.RateLimitedError as exc:
-                if exc.retry_after > max_backoff:
-                    raise
-
-                retry.set_next_backoff(exc.retry_after)
-
-            except hikari.InternalServerError:
-                continue
-
-            else:
-                break
-
-        else:
-            message = await rest.create_message(channel_id, content=entry[0], embed=entry[1])
+        message = await _execute_with_backoff(
+            lambda: rest.create_message(channel_id, content=entry[0], embed=entry[1]),
+            backoff.Backoff(max_retries=max_retries - 1, maximum=max_backoff),
+            raise_if_over=max_backoff,
+            final_attempt=True,
+        )
+        assert message is not None  # This can't be None with final_attempt=True.
 
         await self.open(message, add_reactions=add_reactions, max_retries=max_retries, max_backoff=max_backoff)
         return message
@@ -668,12 +907,32 @@ class ReactionClient:
         The event manager client to register this reaction client with.
     """
 
-    __slots__ = ("blacklist", "_event_manager", "_gc_task", "_handlers", "_rest")
+    __slots__ = (
+        "blacklist",
+        "_event_manager",
+        "_gc_task",
+        "_gc_wake",
+        "_handlers",
+        "_open",
+        "_reaction_callback",
+        "_rest",
+        "_starting_callback",
+        "_stopping_callback",
+    )
 
     def __init__(self, *, rest: hikari.api.RESTClient, event_manager: hikari.api.EventManager) -> None:
-        self.blacklist: typing.List[hikari.Snowflake] = []
+        self.blacklist: typing.Set[hikari.Snowflake] = set()
         self._event_manager = event_manager
         self._gc_task: typing.Optional[asyncio.Task[None]] = None
+        self._gc_wake: typing.Optional[asyncio.Event] = None
+        self._open = False
+        # These are bound once here so subscribe and unsubscribe pass the identical method
+        # object rather than allocating a fresh binding at each lifecycle call.
+        self._reaction_callback = self._on_reaction_event
+        self._starting_callback = self._on_starting_event
+        self._stopping_callback = self._on_stopping_event
+        # Dispatch is a single hash probe on the message ID so a plain dict is already optimal
+        # here; only the gc sweep ever iterates this.
         self._handlers: typing.Dict[hikari.Snowflake, AbstractReactionHandler] = {}
         self._rest = rest
 
@@ -694,28 +953,50 @@ class ReactionClient:
         return cls(rest=bot.rest, event_manager=bot.event_manager)
 
     async def _gc(self) -> None:
+        wake = self._gc_wake = asyncio.Event()
         while True:
-            for listener_id, listener in tuple(self._handlers.items()):
-                if not listener.has_expired or listener_id not in self._handlers:
-                    continue
-
-                del self._handlers[listener_id]
+            # The handlers dict can only mutate when this yields so the expiry scan runs over it
+            # directly, only collecting the (usually zero) expired entries instead of snapshotting
+            # every listener each tick.
+            expired: typing.List[typing.Tuple[hikari.Snowflake, AbstractReactionHandler]] = []
+            for listener_id, listener in self._handlers.items():
+                if listener.has_expired:
+                    expired.append((listener_id, listener))
+
+            for listener_id, listener in expired:
+                self._handlers.pop(listener_id, None)
                 # This may slow this gc task down but the more we yield the better.
                 await listener.close()
 
-            await asyncio.sleep(5)  # TODO: is this a good time?
+            # Park indefinitely while there's nothing to collect; `ReactionClient.add_handler`
+            # wakes this back up. With live listeners we still fall back to a bounded tick as
+            # their expiry times shift on every dispatched reaction. This single sleeper is the
+            # only timer the client ever arms - no per-listener call_later handles exist to
+            # cancel and tombstone when a handler is triggered or closed early.
+            if self._handlers:
+                try:
+                    await asyncio.wait_for(wake.wait(), timeout=5)
+                except asyncio.TimeoutError:
+                    pass
+
+            else:
+                await wake.wait()
+
+            wake.clear()
 
     async def _on_reaction_event(
         self, event: typing.Union[hikari.ReactionAddEvent, hikari.ReactionDeleteEvent], /
     ) -> None:
-        if event.user_id in self.blacklist:
+        # The message ID probe comes first since it prunes nearly all reaction traffic for a
+        # bot with only a few active handlers; the blacklist is only consulted on a hit.
+        listener = self._handlers.get(event.message_id)
+        if listener is None or event.user_id in self.blacklist:
             return
 
-        if listener := self._handlers.get(event.message_id):
-            try:
-                await listener.on_reaction_event(event)
-            except HandlerClosed:
-                self._handlers.pop(event.message_id, None)
+        try:
+            await listener.on_reaction_event(event)
+        except HandlerClosed:
+            self._handlers.pop(event.message_id, None)
 
     async def _on_starting_event(self, _: hikari.StartingEvent, /) -> None:
         await self.open()
@@ -725,7 +1006,7 @@ class ReactionClient:
 
     @property
     def is_closed(self) -> bool:
-        return self._gc_task is None
+        return not self._open
 
     def add_handler(
         self: _ReactionClientT,
@@ -745,7 +1026,10 @@ class ReactionClient:
         paginator : AbstractReactionHandler
             The object of the opened paginator to register in this reaction client.
         """
-        self._handlers[hikari.Snowflake(message)] = paginator
+        self._handlers[_as_snowflake(message)] = paginator
+        if self._gc_wake is not None:
+            self._gc_wake.set()
+
         return self
 
     def get_handler(
@@ -766,7 +1050,7 @@ class ReactionClient:
         AbstractReactionHandler
             The object of the registered paginator if found else `builtins.None`.
         """
-        return self._handlers.get(hikari.Snowflake(message))
+        return self._handlers.get(_as_snowflake(message))
 
     def remove_handler(
         self, message: hikari.SnowflakeishOr[hikari.Message], /
@@ -786,37 +1070,65 @@ class ReactionClient:
         AbstractReactionHandler
             The object of the registered paginator if found else `builtins.None`.
         """
-        return self._handlers.pop(hikari.Snowflake(message))
-
-    def _try_unsubscribe(
-        self,
-        event_type: typing.Type[event_manager_api.EventT],
-        callback: event_manager_api.CallbackT[event_manager_api.EventT],
-    ) -> None:
-        try:
-            self._event_manager.unsubscribe(event_type, callback)
-        except (ValueError, LookupError):
-            # TODO: add logging here
-            pass
+        return self._handlers.pop(_as_snowflake(message))
 
     async def close(self) -> None:
-        """Close this client by unregistering any tasks and event listeners registered by `ReactionClient.open`."""
-        if self._gc_task is not None:
-            self._try_unsubscribe(hikari.StartingEvent, self._on_starting_event)
-            self._try_unsubscribe(hikari.StoppingEvent, self._on_stopping_event)
-            self._try_unsubscribe(hikari.ReactionAddEvent, self._on_reaction_event)  # type: ignore[misc]
-            self._try_unsubscribe(hikari.ReactionDeleteEvent, self._on_reaction_event)  # type: ignore[misc]
-            self._gc_task.cancel()
-            listeners = self._handlers
-            self._handlers = {}
-            await asyncio.gather(*(listener.close() for listener in listeners.values()))
+        """Close this client by unregistering any tasks and event listeners registered by `ReactionClient.open`.
+
+        This is a no-op if the client is already closed.
+        """
+        if not self._open:
+            return
+
+        # The flag is flipped before anything awaits so an overlapping close() call bails at
+        # the guard above instead of double-unsubscribing or re-closing the listeners.
+        self._open = False
+        unsubscribe = self._event_manager.unsubscribe
+        for event_type, callback in (
+            (hikari.StartingEvent, self._starting_callback),
+            (hikari.StoppingEvent, self._stopping_callback),
+            (hikari.ReactionAddEvent, self._reaction_callback),
+            (hikari.ReactionDeleteEvent, self._reaction_callback),
+        ):
+            # TODO: add logging here
+            with contextlib.suppress(ValueError, LookupError):
+                unsubscribe(event_type, callback)  # type: ignore[arg-type]
+
+        # open() always creates the gc task before this can run so the assertion only
+        # documents that invariant for the type checker.
+        assert self._gc_task is not None
+        self._gc_task.cancel()
+        self._gc_task = None
+        self._gc_wake = None
+
+        # The close coroutines are materialized and the handler table swapped out before
+        # anything awaits, so concurrent dispatch and add_handler calls only ever see the
+        # empty replacement and the old dict is freed without being pinned across the await.
+        coroutines = tuple(listener.close() for listener in self._handlers.values())
+        self._handlers = {}
+        if coroutines:
+            await _gather_bounded(coroutines)
 
     async def open(self) -> None:
-        """Start this client by registering the required tasks and event listeners for it to function."""
-        if self._gc_task is None:
-            self._gc_task = asyncio.create_task(self._gc())
-            self.blacklist.append((await self._rest.fetch_my_user()).id)
-            self._event_manager.subscribe(hikari.StartingEvent, self._on_starting_event)
-            self._event_manager.subscribe(hikari.StoppingEvent, self._on_stopping_event)
-            self._event_manager.subscribe(hikari.ReactionAddEvent, self._on_reaction_event)
-            self._event_manager.subscribe(hikari.ReactionDeleteEvent, self._on_reaction_event)
+        """Start this client by registering the required tasks and event listeners for it to function.
+
+        This is a no-op if the client is already open, so repeated calls won't
+        stack duplicate event subscriptions.
+        """
+        if self._open:
+            return
+
+        self._open = True
+        self._gc_task = asyncio.create_task(self._gc())
+
+        # The REST request is started before the (synchronous) subscribe calls so they run
+        # while it's in flight rather than waiting out the round-trip first.
+        me_future = asyncio.ensure_future(self._rest.fetch_my_user())
+        self._event_manager.subscribe(hikari.StartingEvent, self._starting_callback)
+        self._event_manager.subscribe(hikari.StoppingEvent, self._stopping_callback)
+        # These stay as two precise subscriptions rather than one on hikari.ReactionEvent:
+        # the shared base also covers the bulk delete-all/delete-emoji events which carry no
+        # user_id and would need filtering back out of the dispatch path.
+        self._event_manager.subscribe(hikari.ReactionAddEvent, self._reaction_callback)
+        self._event_manager.subscribe(hikari.ReactionDeleteEvent, self._reaction_callback)
+        self.blacklist.add((await me_future).id)